@@ -1,38 +1,77 @@
 #Librerias
 import os
+import itertools
+import math
+import random
 import threading
 import queue
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+# Compatible con Pillow-SIMD (pip uninstall pillow && pip install pillow-simd):
+# mismo import, pero BLUR/SHARPEN/CONTOUR/FIND_EDGES y convert usan SSE4/AVX2
+import PIL
 from PIL import Image, ImageFilter, ImageTk
 import tkinter.font as tkFont
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import subprocess
 import platform
 
 # Para habilitar el Drag & Drop en la interfaz
 from tkinterdnd2 import TkinterDnD, DND_FILES
 
+# Carga simulada por imagen (segundos), solo para demos: SIMULATE_LOAD=0.1
+SIMULATE_LOAD = float(os.environ.get("SIMULATE_LOAD", "0"))
+
+# Filtros de PIL por nombre: una búsqueda en el diccionario en vez de la cadena de if/elif
+_FILTER_DISPATCH = {
+    "Desenfoque": lambda img: img.filter(ImageFilter.BLUR),
+    "Grises": lambda img: img.convert('L'),
+    "Contorno": lambda img: img.filter(ImageFilter.CONTOUR),
+    "Emboss": lambda img: img.filter(ImageFilter.EMBOSS),
+    "Sharpen": lambda img: img.filter(ImageFilter.SHARPEN),
+    "Detalles": lambda img: img.filter(ImageFilter.DETAIL),
+    "Bordes": lambda img: img.filter(ImageFilter.FIND_EDGES),
+}
+
+# Nombres visibles de cada estrategia paralela y de sus trabajadores
+STRATEGY_NAMES = {"multithread": "Multihilo", "multiprocess": "Multiproceso", "actor": "Modelo Actor"}
+WORKER_NAMES = {"multithread": "hilos", "multiprocess": "procesos", "actor": "actores"}
+
+# Cada UI_POLL_MS la interfaz toma como máximo UI_POLL_MAX resultados de la cola
+UI_POLL_MS = 50
+UI_POLL_MAX = 100
+
+# OpenCV opcional: convolución por lotes con filter2D (pip install opencv-python)
+try:
+    import cv2
+    import numpy as np
+    # Un hilo por llamada: el paralelismo lo ponen las estrategias; así la versión
+    # secuencial se mide realmente en un solo hilo y los hilos no compiten por núcleos
+    cv2.setNumThreads(1)
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
 # ==========MECANISMOS DE SINCRONIZACIÓN ==========
 class SharedCounter:
-    """Contador compartido con protección por Lock (Mutex)"""
+    """Contador compartido sin Lock: next() de itertools.count es atómico bajo el GIL"""
     def __init__(self):
-        self._value = 0 #Valor Inicial del contador.
-        self._lock = threading.Lock() #Lock
+        self._counter = itertools.count(1) #Siguiente valor del contador
+        self._last = 0 #Último valor entregado
     
-    #Funcion de incremento para el Lock
+    #Funcion de incremento (sin Lock)
     def increment(self):
-        with self._lock:
-            self._value += 1
-            return self._value
+        self._last = next(self._counter)
+        return self._last
     
-    #Funcion para obtener el estado del Lock
+    #Funcion para obtener el valor del contador
     def get_value(self):
-        with self._lock:
-            return self._value
+        # Lectura aproximada (último valor publicado), suficiente para mostrar en pantalla
+        return self._last
 
 #SEMAFORO
 class ProcessingSemaphore: #Semaforos
@@ -56,32 +95,97 @@ class ProcessingSemaphore: #Semaforos
         with self._lock:
             return self.active_processes #Obtiene la cantidad de procesos
 
+#ROBO DE TRABAJO
+class WorkStealingRun:
+    """
+    Reparto de tareas entre hilos con una deque por trabajador (robo de trabajo).
+    Cada hilo toma tareas del frente de su deque; cuando se vacía, roba
+    la mitad de las tareas del final de la deque de otro hilo al azar.
+    No es un pool persistente: cada llamada a imap_unordered crea sus num_workers
+    hilos y estos terminan al agotarse las tareas. Crear unos pocos hilos por
+    ejecución cuesta muy poco frente a filtrar las imágenes.
+    """
+    def __init__(self, num_workers):
+        self.num_workers = num_workers
+    
+    def imap_unordered(self, func, tasks):
+        """Aplica func a cada tarea y entrega los resultados en orden de término"""
+        # Estado local de cada llamada: hilos de una llamada anterior que terminó con error
+        # no pueden tomar tareas ni publicar resultados de esta
+        deques = [deque() for _ in range(self.num_workers)]
+        locks = [threading.Lock() for _ in range(self.num_workers)]
+        results = queue.Queue()
+        
+        # Reparto inicial round-robin entre las deques
+        for i, task in enumerate(tasks):
+            deques[i % self.num_workers].append(task)
+        
+        for worker_id in range(self.num_workers):
+            threading.Thread(target=self._work, args=(worker_id, func, deques, locks, results),
+                             daemon=True).start()
+        
+        for _ in range(len(tasks)):
+            ok, value = results.get()
+            if not ok:
+                raise value
+            yield value
+    
+    #Ejecucion de cada hilo trabajador
+    def _work(self, worker_id, func, deques, locks, results):
+        while True:
+            task = self._pop(worker_id, deques, locks)
+            if task is None:
+                task = self._steal(worker_id, deques, locks)
+                if task is None:  # No quedan tareas en ninguna deque
+                    break
+            try:
+                results.put((True, func(task)))
+            except Exception as e:
+                results.put((False, e))
+    
+    def _pop(self, worker_id, deques, locks):
+        with locks[worker_id]:
+            own = deques[worker_id]
+            return own.popleft() if own else None
+    
+    def _steal(self, worker_id, deques, locks):
+        victims = [v for v in range(self.num_workers) if v != worker_id]
+        random.shuffle(victims)
+        for victim in victims:
+            with locks[victim]:
+                target = deques[victim]
+                # Roba la mitad (redondeando arriba) desde el final opuesto al dueño
+                stolen = [target.pop() for _ in range((len(target) + 1) // 2)]
+            if stolen:
+                task = stolen.pop()
+                if stolen:
+                    with locks[worker_id]:
+                        deques[worker_id].extend(reversed(stolen))
+                return task
+        return None
+
 # ========== MODELO ACTOR (PATRÓN ACTOR) ==========
 class ProcessingActor:
-    """Actor simple para procesamiento de tareas"""
-    def __init__(self, result_queue):
-        self.task_queue = queue.Queue() #Lista de Tareas para actores
+    """Actor simple para procesamiento de tareas (toma trabajo de una cola compartida)"""
+    def __init__(self, task_queue, result_queue, worker):
+        self.task_queue = task_queue #Cola de tareas compartida por todos los actores
         self.result_queue = result_queue
-        self._running = True #Estado de ejecucion
+        self.worker = worker #Función que procesa cada mensaje (rutas de entrada y salida)
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
     
     #Ejecucion de Actor
     def _run(self):
-        while self._running:
-            try:
-                task = self.task_queue.get(timeout=1)
-                result = process_image(task)
-                self.result_queue.put(result)
-            except queue.Empty:
-                continue
-    
-    def submit(self, task):
-        self.task_queue.put(task)
+        while True:
+            task = self.task_queue.get()  # Bloquea sin sondeo hasta recibir mensaje
+            if task is None:  # Centinela de alto
+                break
+            self.result_queue.put(self.worker(*task))  # task: (ruta_imagen, ruta_salida)
     
     #Señal de alto para actor
     def stop(self):
-        self._running = False
+        # Cada centinela detiene a un actor, el primero que lo tome
+        self.task_queue.put(None)
 
 # ========== VERSIÓN SECUENCIAL ==========
 def process_image_sequential(image_paths, selected_filter, output_folder):
@@ -90,8 +194,8 @@ def process_image_sequential(image_paths, selected_filter, output_folder):
     start_time = time.time() #Tiempo de inicio
     
     #Para agregar al final del nombre del archivo "Secuencial", solo para identificar por que medio se proceso la imagen
-    for image_path in image_paths: 
-        result = process_image((image_path, selected_filter, output_folder, "secuencial"))
+    for image_path, output_path in _build_output_paths(image_paths, output_folder, "secuencial"): 
+        result = process_image(image_path, output_path, selected_filter, "secuencial")
         results.append(result)
     
     elapsed_time = time.time() - start_time  #Tiempo de inicio
@@ -101,20 +205,22 @@ def process_image_sequential(image_paths, selected_filter, output_folder):
 def process_image_actor(image_paths, selected_filter, output_folder, num_actors=4):
     """Procesamiento usando modelo Actor"""
     results = []
+    task_queue = queue.SimpleQueue()  # Buzón único (implementado en C): el actor libre toma la siguiente imagen
     result_queue = queue.Queue()
     actors = []
+    # Filtro y método son iguales para todas las imágenes: los mensajes solo llevan las rutas
+    worker = partial(process_image, selected_filter=selected_filter, method="actor")
     
     # Crear actores
     for _ in range(num_actors):
-        actor = ProcessingActor(result_queue)
+        actor = ProcessingActor(task_queue, result_queue, worker)
         actors.append(actor)
     
     start_time = time.time()
     
-    # Distribuir tareas entre actores (round-robin)
-    for i, image_path in enumerate(image_paths):
-        task = (image_path, selected_filter, output_folder, "actor")
-        actors[i % num_actors].submit(task)
+    # Encolar tareas; cada actor toma una nueva al terminar la anterior (balanceo dinámico)
+    for task in _build_output_paths(image_paths, output_folder, "actor"):
+        task_queue.put(task)
     
     # Recoger resultados
     for _ in range(len(image_paths)):
@@ -128,56 +234,230 @@ def process_image_actor(image_paths, selected_filter, output_folder, num_actors=
     elapsed_time = time.time() - start_time #Tiempo de inicio
     return results, elapsed_time
 
+# ========== VERSIÓN POR LOTES CON OPENCV ==========
+def _cv2_kernel(pil_filter):
+    """Convierte un filtro de PIL en (kernel, offset) para cv2.filter2D"""
+    size, scale, offset, kernel = pil_filter.filterargs
+    kernel = np.array(kernel, dtype=np.float32).reshape(size[1], size[0]) / scale
+    # PIL aplica la primera fila del kernel a la fila de abajo
+    return np.flipud(kernel), offset
+
+if HAS_CV2:
+    CV2_KERNELS = {
+        "Desenfoque": _cv2_kernel(ImageFilter.BLUR),
+        "Contorno": _cv2_kernel(ImageFilter.CONTOUR),
+        "Emboss": _cv2_kernel(ImageFilter.EMBOSS),
+        "Sharpen": _cv2_kernel(ImageFilter.SHARPEN),
+        "Detalles": _cv2_kernel(ImageFilter.DETAIL),
+        "Bordes": _cv2_kernel(ImageFilter.FIND_EDGES),
+    }
+
+def _build_output_paths(image_paths, output_folder, method):
+    """
+    Calcula una sola vez, en quien reparte el trabajo, las rutas de salida con formato
+    nombre_original_metodo.extension; devuelve [(ruta_imagen, ruta_salida), ...]
+    """
+    path = os.path  # Alias local: evita buscar os.path en cada iteración
+    tasks = []
+    for image_path in image_paths:
+        name, ext = path.splitext(path.basename(image_path))
+        tasks.append((image_path, path.join(output_folder, f"{name}_{method}{ext}")))
+    return tasks
+
+# Formatos que OpenCV decodifica y codifica; el resto (p. ej. GIF) pasa por PIL
+CV2_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp"}
+
+def _use_cv2(image_path, selected_filter):
+    return (HAS_CV2 and (selected_filter in CV2_KERNELS or selected_filter == "Grises")
+            and os.path.splitext(image_path)[1].lower() in CV2_EXTENSIONS)
+
+def _read_cv2(image_path):
+    """Decodifica con OpenCV desde los bytes del archivo (admite rutas con acentos); None si falla"""
+    try:
+        # IGNORE_ORIENTATION: como PIL, no se rota según la etiqueta EXIF Orientation
+        return cv2.imdecode(np.fromfile(image_path, dtype=np.uint8),
+                            cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    except (OSError, cv2.error):
+        return None
+
+def _write_cv2(output_path, img):
+    """Codifica en memoria y escribe el archivo; False si OpenCV no puede codificarlo"""
+    ext = os.path.splitext(output_path)[1]
+    # Misma calidad JPEG que Image.save() por defecto (OpenCV usa 95)
+    params = [cv2.IMWRITE_JPEG_QUALITY, 75] if ext.lower() in (".jpg", ".jpeg") else []
+    try:
+        ok, buffer = cv2.imencode(ext, img, params)
+        if ok:
+            buffer.tofile(output_path)
+        return ok
+    except (OSError, cv2.error):
+        return False
+
+def _result_ok(image_path, output_path, selected_filter, method):
+    """Diccionario de resultado para una imagen procesada correctamente"""
+    return {
+        "status": "OK", 
+        "original": image_path, 
+        "output": output_path, 
+        "message": f"Procesado: {os.path.basename(image_path)} ({method})", 
+        "filter": selected_filter,
+        "method": method
+    }
+
+# Máximo de bytes de imágenes decodificadas que un lote acumula antes de filtrarlas;
+# limita la memoria por hilo (imágenes + buffer apilado + buffer filtrado ~ 3 veces esto)
+BATCH_MAX_BYTES = 64 * 1024 * 1024
+
+def _result_error(image_path, method, error):
+    """Diccionario de resultado para una imagen que no se pudo procesar"""
+    return {
+        "status": "ERROR", 
+        "original": image_path, 
+        "message": f"Error en {os.path.basename(image_path)}: {str(error)}",
+        "method": method
+    }
+
+def _flush_groups(groups, selected_filter, method):
+    """Filtra los grupos pendientes; si un grupo falla, sus imágenes se reportan con ERROR"""
+    results = []
+    for items in groups.values():
+        try:
+            results.extend(_filter_group(items, selected_filter, method))
+        except Exception as e:
+            results.extend(_result_error(image_path, method, e) for image_path, _, _ in items)
+    groups.clear()
+    return results
+
+def _filter_group(items, selected_filter, method):
+    """Filtra con una sola llamada a cv2.filter2D un grupo de imágenes del mismo ancho"""
+    results = []
+    kernel, offset = CV2_KERNELS[selected_filter]
+    pad = kernel.shape[0] // 2
+    # Un solo buffer para todo el grupo: cada imagen y su relleno se escriben en su rebanada,
+    # sin arreglos temporales por imagen ni la copia extra de np.concatenate
+    total_rows = sum(img.shape[0] + 2 * pad for _, _, img in items)
+    stacked = np.empty((total_rows,) + items[0][2].shape[1:], dtype=np.uint8)
+    row = 0
+    for _, _, img in items:
+        height = img.shape[0]
+        # Relleno arriba y abajo (repite el borde) para que el kernel no mezcle imágenes vecinas
+        stacked[row:row + pad] = img[0]
+        stacked[row + pad:row + pad + height] = img
+        stacked[row + pad + height:row + height + 2 * pad] = img[-1]
+        row += height + 2 * pad
+    filtered = cv2.filter2D(stacked, -1, kernel, delta=offset, borderType=cv2.BORDER_REPLICATE)
+    
+    row = 0
+    for image_path, output_path, img in items:
+        height = img.shape[0]
+        out = filtered[row + pad:row + pad + height]
+        row += height + 2 * pad
+        if _write_cv2(output_path, out):
+            results.append(_result_ok(image_path, output_path, selected_filter, method))
+        else:
+            results.append(_process_image_pil(image_path, output_path, selected_filter, method))
+    return results
+
+def process_image_batch(tasks, selected_filter, method):
+    """
+    Procesa un lote de tareas (ruta_imagen, ruta_salida) con pocas llamadas a cv2.filter2D.
+    Las imágenes del mismo ancho se apilan verticalmente, separadas por filas de
+    relleno, y se filtran juntas; después se recorta cada una de su posición.
+    Cuando lo acumulado pasa de BATCH_MAX_BYTES se filtra y se libera antes de seguir.
+    Sin OpenCV, o para formatos que no maneja (GIF), se usa process_image; si OpenCV
+    no puede leer o escribir una imagen se pasa directo a la ruta PIL (una sola pausa por imagen).
+    """
+    results = []
+    groups = {}  # (ancho, canales) -> [(ruta, ruta_salida, imagen)]
+    pending_bytes = 0
+    for image_path, output_path in tasks:
+        if not _use_cv2(image_path, selected_filter):
+            results.append(process_image(image_path, output_path, selected_filter, method))
+            continue
+        if SIMULATE_LOAD > 0:
+            time.sleep(SIMULATE_LOAD)  # Simula carga de trabajo
+        try:
+            img = _read_cv2(image_path)
+            if img is None:
+                results.append(_process_image_pil(image_path, output_path, selected_filter, method))
+                continue
+            if selected_filter == "Grises":
+                # Escala de grises: conversión vectorizada por imagen, no necesita apilar
+                if _write_cv2(output_path, cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)):
+                    results.append(_result_ok(image_path, output_path, selected_filter, method))
+                else:
+                    results.append(_process_image_pil(image_path, output_path, selected_filter, method))
+                continue
+        except Exception as e:
+            results.append(_result_error(image_path, method, e))
+            continue
+        groups.setdefault(img.shape[1:], []).append((image_path, output_path, img))
+        pending_bytes += img.nbytes
+        if pending_bytes >= BATCH_MAX_BYTES:
+            results.extend(_flush_groups(groups, selected_filter, method))
+            pending_bytes = 0
+    
+    results.extend(_flush_groups(groups, selected_filter, method))
+    return results
+
 ##==============================APLICACIÓN PRINCIPAL==============================##
-def process_image(args):
+def process_image(image_path, output_path, selected_filter, method):
     """
     Procesa una imagen aplicándole el filtro seleccionado.
     Recibe:
-       args: tupla (ruta_imagen, filtro_seleccionado, carpeta_salida, metodo)
+       image_path: ruta de la imagen
+       output_path: ruta de salida (ver _build_output_paths)
+       selected_filter: filtro seleccionado
+       method: método de procesamiento (se guarda en el resultado)
     """
-    image_path, selected_filter, output_folder, method = args
     try:
-        # Simular tiempo de procesamiento variable
-        time.sleep(0.1)  # Simula carga de trabajo
-        
+        if SIMULATE_LOAD > 0:
+            time.sleep(SIMULATE_LOAD)  # Simula carga de trabajo
+        
+        # Ruta OpenCV: decodificar -> filtrar en un buffer preasignado -> codificar,
+        # sin las copias intermedias de PIL (convert, filter, save)
+        if _use_cv2(image_path, selected_filter):
+            img = _read_cv2(image_path)
+            if img is not None:
+                if selected_filter == "Grises":
+                    out = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+                else:
+                    kernel, offset = CV2_KERNELS[selected_filter]
+                    out = np.empty_like(img)
+                    cv2.filter2D(img, -1, kernel, dst=out, delta=offset,
+                                 borderType=cv2.BORDER_REPLICATE)
+                if _write_cv2(output_path, out):
+                    return _result_ok(image_path, output_path, selected_filter, method)
+    except Exception as e:
+        return _result_error(image_path, method, e)
+    
+    return _process_image_pil(image_path, output_path, selected_filter, method)
+
+def _process_image_pil(image_path, output_path, selected_filter, method):
+    """Ruta PIL de process_image, sin la pausa de SIMULATE_LOAD ni el intento con OpenCV.
+    Los lotes la llaman directo cuando OpenCV no pudo leer o escribir una imagen"""
+    try:
         img = Image.open(image_path).convert("RGB")
-        if selected_filter == "Desenfoque":
-            img = img.filter(ImageFilter.BLUR)
-        elif selected_filter == "Grises":
-            img = img.convert('L')
-        elif selected_filter == "Contorno":
-            img = img.filter(ImageFilter.CONTOUR)
-        elif selected_filter == "Emboss":
-            img = img.filter(ImageFilter.EMBOSS)
-        elif selected_filter == "Sharpen":
-            img = img.filter(ImageFilter.SHARPEN)
-        elif selected_filter == "Detalles":
-            img = img.filter(ImageFilter.DETAIL)
-        elif selected_filter == "Bordes":
-            img = img.filter(ImageFilter.FIND_EDGES)
-        
-        base = os.path.basename(image_path)
-        name, ext = os.path.splitext(base)
-        # Formato: nombre_original_metodo.extension
-        output_filename = f"{name}_{method}{ext}"
-        output_path = os.path.join(output_folder, output_filename)
+        apply_filter = _FILTER_DISPATCH.get(selected_filter)
+        if apply_filter is not None:
+            img = apply_filter(img)
+        
         img.save(output_path)
         
-        return {
-            "status": "OK", 
-            "original": image_path, 
-            "output": output_path, 
-            "message": f"Procesado: {base} ({method})", 
-            "filter": selected_filter,
-            "method": method
-        }
+        return _result_ok(image_path, output_path, selected_filter, method)
     except Exception as e:
-        return {
-            "status": "ERROR", 
-            "original": image_path, 
-            "message": f"Error en {os.path.basename(image_path)}: {str(e)}",
-            "method": method
-        }
+        return _result_error(image_path, method, e)
+
+#Miniaturas para la vista previa
+@lru_cache(maxsize=64)
+def _load_thumb(path, mtime, zoom):
+    """Abre y reduce la imagen una sola vez por (ruta, fecha de modificación, zoom)"""
+    with Image.open(path) as img:
+        img.thumbnail((zoom, zoom))
+        # RGB/RGBA es lo que Tk muestra directo: ImageTk.PhotoImage no tiene que convertir
+        # otra vez, y convert() deja la imagen decodificada en memoria al cerrar el archivo
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        return img.convert("RGBA" if has_alpha else "RGB")
 
 #Funcion para seleccionar carpetas
 def open_folder(path):
@@ -219,13 +499,15 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.output_folder = os.path.join(os.getcwd(), "output")
         os.makedirs(self.output_folder, exist_ok=True)
         
-        # Executor para multihilo (se inicializa con num_threads)
-        self.thread_executor = ThreadPoolExecutor(max_workers=self.num_threads)
+        # Executor para multiproceso: cada proceso tiene su propio intérprete (sin GIL compartido)
+        self.process_executor = ProcessPoolExecutor(max_workers=self.num_threads)
+        self.warm_process_pool()
         
         # Métricas de desempeño
         self.metrics = {
             "Secuencial": [],
             "Multihilo": [],
+            "Multiproceso": [],
             "Modelo Actor": []
         }
         
@@ -236,9 +518,16 @@ class PhotoFilterApp(TkinterDnD.Tk):
         }
         
         self.zoom_level = 300
+        self.ui_queue = queue.Queue()  # Resultados que publican los hilos de trabajo para la interfaz
+        self._ui_poll_id = None  # Revisión periódica de ui_queue (solo durante Multihilo)
+        self._zoom_after_id = None  # Actualización de zoom pendiente (debounce)
         self.currently_processing = False
         self.init_styles()
         self.create_widgets()
+        self.check_pillow_version()
+        
+        # Al cerrar la ventana se liberan los procesos de trabajo
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def init_styles(self):
         style = ttk.Style(self)
@@ -269,6 +558,8 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.strategy_var = tk.StringVar(value="multithread")
         ttk.Radiobutton(strategies_frame, text="Multihilo", variable=self.strategy_var,
                        value="multithread").pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(strategies_frame, text="Multiproceso", variable=self.strategy_var,
+                       value="multiprocess").pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(strategies_frame, text="Modelo Actor", variable=self.strategy_var,
                        value="actor").pack(side=tk.LEFT, padx=5)
         
@@ -447,13 +738,31 @@ class PhotoFilterApp(TkinterDnD.Tk):
         graph_frame = ttk.Frame(self.notebook)
         self.notebook.add(graph_frame, text="Comparación de Tiempos")
         
-        self.figure, self.ax = plt.subplots(figsize=(8, 4))
-        self.figure.patch.set_facecolor('#2C3E50')
-        self.ax.set_facecolor('#34495E')
-        self.canvas = FigureCanvasTkAgg(self.figure, graph_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Canvas de Tk: dibujar dos barras es inmediato comparado con redibujar una figura de matplotlib
+        self.chart_canvas = tk.Canvas(graph_frame, bg="#34495E", height=300, highlightthickness=0)
+        self.chart_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._chart_strategy = None  # Estrategia del último gráfico dibujado
+        self.chart_canvas.bind("<Configure>", self.redraw_chart)
     
 #=================================ACTUALIZADOR DE CANTIDAD DE HILOS=======================================
+    def warm_process_pool(self):
+        """Lanza los procesos del pool desde ahora (sin esperar), para que la primera
+        ejecución no pague el costo de crearlos"""
+        for _ in range(self.num_threads):
+            self.process_executor.submit(int)
+    
+    def check_pillow_version(self):
+        """Avisa en el log si la versión de Pillow no libera el GIL en los filtros"""
+        # Pillow >= 9.0: los filtros liberan el GIL, así los hilos pueden filtrar en paralelo
+        if tuple(int(p) for p in PIL.__version__.split(".")[:2]) < (9, 0):
+            self.log_message(f"Aviso: Pillow {PIL.__version__} puede no liberar el GIL en los filtros; "
+                             "la versión Multihilo no escalará (se recomienda Pillow>=9.0)")
+    
+    def on_close(self):
+        """Cierra la ventana cancelando las tareas pendientes del pool de procesos"""
+        self.process_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+    
     def update_threads(self):
         """Actualiza el número de hilos basado en la selección del usuario"""
         try:
@@ -462,11 +771,10 @@ class PhotoFilterApp(TkinterDnD.Tk):
                 if new_threads != self.num_threads:
                     self.num_threads = new_threads
                     
-                    # Recrear el ThreadPoolExecutor con el nuevo número de hilos
-                    if hasattr(self, 'thread_executor'):
-                        self.thread_executor.shutdown(wait=False)
-                    
-                    self.thread_executor = ThreadPoolExecutor(max_workers=self.num_threads)
+                    # Recrear el pool de procesos (los hilos de Multihilo se crean en cada ejecución)
+                    self.process_executor.shutdown(wait=False)
+                    self.process_executor = ProcessPoolExecutor(max_workers=self.num_threads)
+                    self.warm_process_pool()
                     
                     # Actualizar etiqueta
                     self.threads_label.config(
@@ -550,9 +858,8 @@ class PhotoFilterApp(TkinterDnD.Tk):
                 if index < len(self.image_paths):
                     image_path = self.image_paths[index]
                     
-                    # Vista original
-                    img = Image.open(image_path)
-                    img.thumbnail((self.zoom_level, self.zoom_level))
+                    # Vista original (miniatura en caché; mtime invalida si el archivo cambia)
+                    img = _load_thumb(image_path, os.path.getmtime(image_path), self.zoom_level)
                     self.orig_preview_image = ImageTk.PhotoImage(img)
                     self.orig_preview_label.config(image=self.orig_preview_image, text="")
                     
@@ -569,9 +876,16 @@ class PhotoFilterApp(TkinterDnD.Tk):
     def adjust_zoom(self, event):
         try:
             self.zoom_level = int(float(event))
-            self.update_preview()
+            # Al arrastrar el slider llegan muchos eventos: solo se actualiza 50 ms después del último
+            if self._zoom_after_id is not None:
+                self.after_cancel(self._zoom_after_id)
+            self._zoom_after_id = self.after(50, self._apply_zoom)
         except Exception as e:
             self.log_message(f"Error ajustando zoom: {str(e)}")
+    
+    def _apply_zoom(self):
+        self._zoom_after_id = None
+        self.update_preview()
     #====================FUNCION DE LOGS=====================
     def log_message(self, message):
         self.log.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
@@ -627,7 +941,7 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.log.delete("1.0", tk.END)
         self.log_message("Iniciando comparación: Secuencial vs Paralelo...")
         self.log_message(f"Filtro seleccionado: {selected_filter}")
-        self.log_message(f"Estrategia paralela: {'Multihilo' if parallel_strategy == 'multithread' else 'Modelo Actor'}")
+        self.log_message(f"Estrategia paralela: {STRATEGY_NAMES[parallel_strategy]}")
         self.log_message(f"Número de hilos: {self.num_threads}")
         
         # Iniciar procesamiento secuencial primero
@@ -651,12 +965,12 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.execution_times["Secuencial"] = elapsed
         self.all_results.extend(results)
         
-        # Actualizar progreso
-        for _ in results:
-            self.after(0, self.update_progress)
-        
-        self.after(0, self.log_message, f"✓ Secuencial completado en {elapsed:.2f} segundos")
-        self.after(0, self.log_message, f"   - Imágenes procesadas: {len(results)}")
+        # Actualizar progreso y log con una sola llamada cada uno por fase
+        self.after(0, self.update_progress, len(results))
+        self.after(0, self.log_message, "\n".join([
+            f"✓ Secuencial completado en {elapsed:.2f} segundos",
+            f"   - Imágenes procesadas: {len(results)}",
+        ]))
         
         # Pequeña pausa entre procesos
         time.sleep(0.5)
@@ -666,7 +980,11 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.after(0, self.update_status, "Procesando (Paralelo)...")
         
         if parallel_strategy == "multithread":#Multihilo
+            # Publica cada resultado en ui_queue: se revisa solo mientras dure esta fase
+            self.after(0, self.poll_ui_queue)
             results, elapsed = self.run_multithread_version(selected_filter)
+        elif parallel_strategy == "multiprocess":#Multiproceso
+            results, elapsed = self.run_multiprocess_version(selected_filter)
         else:  # actor
             results, elapsed = self.run_actor_version(selected_filter)
         
@@ -674,12 +992,16 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.execution_times["Paralelo"] = elapsed
         self.all_results.extend(results)
         
-        # Actualizar progreso
-        for _ in results:
-            self.after(0, self.update_progress)
-        
-        self.after(0, self.log_message, f"✓ Paralelo completado en {elapsed:.2f} segundos")
-        self.after(0, self.log_message, f"   - Imágenes procesadas: {len(results)}")
+        # Actualizar progreso y log con una sola llamada cada uno por fase
+        if parallel_strategy == "multithread":
+            # Multihilo ya publicó cada resultado; se vacía lo pendiente antes del resumen
+            self.after(0, self.stop_ui_polling)
+        else:
+            self.after(0, self.update_progress, len(results))
+        self.after(0, self.log_message, "\n".join([
+            f"✓ Paralelo completado en {elapsed:.2f} segundos",
+            f"   - Imágenes procesadas: {len(results)}",
+        ]))
         
         # Finalizar
         self.after(0, self.finish_processing, parallel_strategy)
@@ -688,37 +1010,86 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.status_label.config(text=status)
 
 #FUNCION QUE OBTIENE EL PROGRESO DEL PROCESO EN CURSO
-    def update_progress(self):
-        self.progress_bar["value"] += 1
+    def poll_ui_queue(self):
+        """Publica en la interfaz los resultados pendientes y se vuelve a programar"""
+        self.drain_ui_queue(UI_POLL_MAX)
+        self._ui_poll_id = self.after(UI_POLL_MS, self.poll_ui_queue)
+    
+    def stop_ui_polling(self):
+        """Detiene la revisión periódica y publica todo lo que quedó en la cola"""
+        if self._ui_poll_id is not None:
+            self.after_cancel(self._ui_poll_id)
+            self._ui_poll_id = None
+        self.drain_ui_queue()
+    
+    def drain_ui_queue(self, limit=None):
+        """Toma hasta limit resultados de la cola y actualiza progreso y log una sola vez"""
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                messages.append(self.ui_queue.get_nowait()["message"])
+            except queue.Empty:
+                break
+        if messages:
+            self.update_progress(len(messages))
+            self.log_message("\n".join(messages))
+    
+    def update_progress(self, steps=1):
+        # Suma directa: progress_bar.step() reinicia la barra al llegar al máximo
+        self.progress_bar["value"] += steps
     
 #===============FUNCION QUE EJECUTA MULTIHILO=================================
     def run_multithread_version(self, selected_filter):
         """Ejecuta la versión multihilo"""
-        tasks = [(path, selected_filter, self.output_folder, "multihilo") for path in self.image_paths]
         start_time = time.time()
         results = []
         
-        # Crear semáforo con el número de hilos configurado
-        semaphore = threading.Semaphore(self.num_threads)
+        # El número de hilos ya limita la concurrencia, no hace falta semáforo
+        process_batch = partial(process_image_batch, selected_filter=selected_filter, method="multihilo")
         
-        def process_with_semaphore(task):
-            semaphore.acquire()
-            try:
-                result = process_image(task)
-                return result
-            finally:
-                semaphore.release()
-        
-        futures = [self.thread_executor.submit(process_with_semaphore, task) for task in tasks]
+        # Lotes pequeños (~4 por hilo): cada uno se filtra con una sola llamada a cv2.filter2D
+        # y los hilos que terminan antes roban lotes pendientes de los demás
+        tasks = _build_output_paths(self.image_paths, self.output_folder, "multihilo")
+        batch_size = max(1, math.ceil(len(tasks) / (self.num_threads * 4)))
+        batches = [tasks[i:i + batch_size] for i in range(0, len(tasks), batch_size)]
         
-        for future in as_completed(futures):
-            result = future.result()
-            results.append(result)
+        # Hilos creados para esta ejecución con el número de hilos actual
+        work_run = WorkStealingRun(self.num_threads)
+        for batch_results in work_run.imap_unordered(process_batch, batches):
+            results.extend(batch_results)
+            # Publicar en cuanto termina cada lote; la interfaz los toma con poll_ui_queue
+            for result in batch_results:
+                self.ui_queue.put(result)
         
         elapsed = time.time() - start_time
         self.metrics["Multihilo"].append(elapsed)
         return results, elapsed
     
+#===============FUNCION QUE EJECUTA MULTIPROCESO=================================
+    def run_multiprocess_version(self, selected_filter):
+        """Ejecuta la versión multiproceso (ProcessPoolExecutor)"""
+        start_time = time.time()
+        
+        # partial de una función de módulo se puede serializar; cada tarea solo envía sus rutas
+        worker = partial(process_image, selected_filter=selected_filter, method="multiproceso")
+        image_paths, output_paths = zip(*_build_output_paths(self.image_paths, self.output_folder, "multiproceso"))
+        # chunksize agrupa varias rutas por envío al proceso, repartiendo el costo de IPC
+        chunksize = max(1, len(image_paths) // (4 * self.num_threads))
+        results = []
+        try:
+            for result in self.process_executor.map(worker, image_paths, output_paths, chunksize=chunksize):
+                results.append(result)
+        except BrokenProcessPool as e:
+            # Un proceso murió (memoria, señal...): las imágenes restantes se reportan
+            # como error y se crea un pool nuevo para las siguientes ejecuciones
+            results.extend(_result_error(path, "multiproceso", e) for path in image_paths[len(results):])
+            self.process_executor = ProcessPoolExecutor(max_workers=self.num_threads)
+            self.warm_process_pool()
+        
+        elapsed = time.time() - start_time
+        self.metrics["Multiproceso"].append(elapsed)
+        return results, elapsed
+    
 #=====================FUNCION QUE EJECUTA ACTORES================================
     def run_actor_version(self, selected_filter):
         """Ejecuta la versión con modelo Actor"""
@@ -764,7 +1135,7 @@ class PhotoFilterApp(TkinterDnD.Tk):
             "Procesamiento Completado", 
             f"Comparación finalizada.\n\n"
             f"Secuencial: {self.execution_times['Secuencial']:.2f}s\n"
-            f"Paralelo ({'Multihilo' if parallel_strategy == 'multithread' else 'Modelo Actor'}): {self.execution_times['Paralelo']:.2f}s\n"
+            f"Paralelo ({STRATEGY_NAMES[parallel_strategy]}): {self.execution_times['Paralelo']:.2f}s\n"
             f"Hilos utilizados: {self.num_threads}\n"
             f"Speedup: {(self.execution_times['Secuencial'] / self.execution_times['Paralelo']):.2f}x\n"
             f"Eficiencia: {((self.execution_times['Secuencial'] / self.execution_times['Paralelo']) / self.num_threads * 100):.1f}%\n\n"
@@ -773,50 +1144,52 @@ class PhotoFilterApp(TkinterDnD.Tk):
     
     #================================FUNCION PARA ACTUALIZAR EL GRAFICO DE COMPARACION==================================
     def update_comparison_chart(self, parallel_strategy_name):
-        """Actualiza el gráfico de comparación"""
-        self.ax.clear()
+        """Actualiza el gráfico de comparación (dos barras dibujadas en un Canvas de Tk)"""
+        self._chart_strategy = parallel_strategy_name  # Para volver a dibujar al cambiar el tamaño
+        canvas = self.chart_canvas
+        canvas.delete("all")
+        
+        width = max(canvas.winfo_width(), 400)
+        height = max(canvas.winfo_height(), 250)
+        top, bottom = 70, height - 40  # Espacio para títulos arriba y etiquetas abajo
         
         # Preparar datos para el gráfico
-        strategies = ["Secuencial", "Paralelo"]
+        parallel_label = f"{STRATEGY_NAMES[parallel_strategy_name]} ({self.num_threads} {WORKER_NAMES[parallel_strategy_name]})"
+        strategies = ["Secuencial", parallel_label]
         times = [self.execution_times["Secuencial"], self.execution_times["Paralelo"]]
-        
         colors = ['#E74C3C', '#3498DB']  # Rojo para secuencial, azul para paralelo
-        
-        bars = self.ax.bar(strategies, times, color=colors)
-        
-        # Personalizar etiqueta del eje X
-        parallel_label = f"Multihilo ({self.num_threads} hilos)" if self.strategy_var.get() == "multithread" else f"Modelo Actor ({self.num_threads} actores)"
-        strategies[1] = parallel_label
-        
-        self.ax.set_xticks(range(len(strategies)))
-        self.ax.set_xticklabels(strategies)
-        
-        self.ax.set_title('Comparación: Tiempo de Ejecución', color='white', fontsize=14)
-        self.ax.set_ylabel('Tiempo (segundos)', color='white')
-        self.ax.tick_params(axis='x', colors='white')
-        self.ax.tick_params(axis='y', colors='white')
-        
-        # Agregar valores encima de las barras
-        for bar, time_val in zip(bars, times):
-            height = bar.get_height()
-            self.ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{time_val:.2f}s', ha='center', va='bottom', color='white', fontweight='bold')
-        
-        # Agregar línea de speedup
+        max_time = max(times) or 1
+        
+        canvas.create_text(width / 2, 18, text="Comparación: Tiempo de Ejecución",
+                           fill="white", font=("Helvetica", 14, "bold"))
+        canvas.create_line(40, bottom, width - 40, bottom, fill="#7F8C8D")
+        
+        # Barras con su tiempo encima y el nombre de la estrategia debajo
+        bar_width = width / 5
+        for i, (label, time_val, color) in enumerate(zip(strategies, times, colors)):
+            center = width * (1 + 2 * i) / 4
+            bar_top = bottom - (bottom - top) * time_val / max_time
+            canvas.create_rectangle(center - bar_width / 2, bar_top, center + bar_width / 2, bottom,
+                                    fill=color, outline="")
+            canvas.create_text(center, bar_top - 10, text=f"{time_val:.2f}s",
+                               fill="white", font=("Helvetica", 11, "bold"))
+            canvas.create_text(center, bottom + 18, text=label, fill="white", font=("Helvetica", 11))
+        
+        # Agregar speedup y eficiencia
         if times[1] > 0:
             speedup = times[0] / times[1]
-            self.ax.text(0.5, 0.95, f'Speedup: {speedup:.2f}x', 
-                       transform=self.ax.transAxes, ha='center', color='#2ECC71',
-                       fontsize=12, fontweight='bold')
+            canvas.create_text(width / 2, 40, text=f"Speedup: {speedup:.2f}x",
+                               fill="#2ECC71", font=("Helvetica", 12, "bold"))
             
-            # Agregar texto de eficiencia
             efficiency = (speedup / self.num_threads) * 100
-            self.ax.text(0.5, 0.90, f'Eficiencia: {efficiency:.1f}% ({self.num_threads} hilos)', 
-                       transform=self.ax.transAxes, ha='center', color='#F39C12',
-                       fontsize=11)
-        
-        self.ax.grid(True, alpha=0.3, linestyle='--')
-        self.canvas.draw()
+            canvas.create_text(width / 2, 58,
+                               text=f"Eficiencia: {efficiency:.1f}% ({self.num_threads} {WORKER_NAMES[parallel_strategy_name]})",
+                               fill="#F39C12", font=("Helvetica", 11))
+    
+    def redraw_chart(self, event=None):
+        """Vuelve a dibujar el gráfico con el nuevo tamaño del Canvas"""
+        if self._chart_strategy is not None:
+            self.update_comparison_chart(self._chart_strategy)
 
 #====================MAIN=================================
 if __name__ == "__main__":
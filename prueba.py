@@ -1,10 +1,16 @@
 import os
+import itertools
+import math
 import threading
 import queue
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from functools import lru_cache
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+# Compatible con Pillow-SIMD (pip uninstall pillow && pip install pillow-simd):
+# mismo import, pero BLUR/SHARPEN/CONTOUR/FIND_EDGES y convert usan SSE4/AVX2
 from PIL import Image, ImageFilter, ImageTk
 import tkinter.font as tkFont
 import matplotlib.pyplot as plt
@@ -13,21 +19,52 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 # Para habilitar el Drag & Drop
 from tkinterdnd2 import TkinterDnD, DND_FILES
 
+# Carga simulada por imagen (segundos), solo para demos: SIMULATE_LOAD=0.1
+SIMULATE_LOAD = float(os.environ.get("SIMULATE_LOAD", "0"))
+
+# Backend OpenCV opcional (pip install opencv-python) para las convoluciones más pesadas
+try:
+    import cv2
+    import numpy as np
+    # Un hilo por llamada: el paralelismo ya lo ponen los pools de hilos y procesos,
+    # y el pool interno de OpenCV solo sobresuscribiría los núcleos
+    cv2.setNumThreads(1)
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
+# Parámetros de guardado por extensión: PNG con compresión rápida (zlib nivel 1)
+# y JPEG calidad 85 con submuestreo 4:2:0
+SAVE_OPTIONS = {
+    ".jpg": {"quality": 85, "subsampling": 2},
+    ".jpeg": {"quality": 85, "subsampling": 2},
+    ".png": {"compress_level": 1},
+}
+
+# Filtros de PIL por nombre, resueltos una sola vez ("Grises" es un cambio de modo)
+FILTERS = {
+    "Desenfoque": ImageFilter.BLUR,
+    "Contorno": ImageFilter.CONTOUR,
+    "Emboss": ImageFilter.EMBOSS,
+    "Sharpen": ImageFilter.SHARPEN,
+    "Detalles": ImageFilter.DETAIL,
+    "Bordes": ImageFilter.FIND_EDGES,
+}
+
 # ==========MECANISMOS DE SINCRONIZACIÓN ==========
 class SharedCounter:
-    """Contador compartido con protección por Lock (Mutex)"""
+    """Contador compartido sin Lock: next() de itertools.count es atómico bajo el GIL"""
     def __init__(self):
-        self._value = 0
-        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self._last = 0
     
     def increment(self):
-        with self._lock:
-            self._value += 1
-            return self._value
+        self._last = next(self._counter)
+        return self._last
     
     def get_value(self):
-        with self._lock:
-            return self._value
+        # Lectura aproximada (último valor publicado), suficiente para mostrar en pantalla
+        return self._last
 
 class ProcessingSemaphore: #Semaforos
     """Semáforo para limitar procesamiento concurrente"""
@@ -52,74 +89,101 @@ class ProcessingSemaphore: #Semaforos
 
 # ========== MODELO ACTOR (PATRÓN ACTOR) ==========
 class ProcessingActor:
-    """Actor simple para procesamiento de tareas"""
-    def __init__(self, result_queue):
-        self.task_queue = queue.Queue()
+    """Actor simple para procesamiento de tareas (toma trabajo de una cola compartida)"""
+    def __init__(self, task_queue, result_queue):
+        self.task_queue = task_queue
         self.result_queue = result_queue
-        self._running = True
         self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
     
     def _run(self):
-        while self._running:
-            try:
-                task = self.task_queue.get(timeout=1)
-                result = process_image(task)
-                self.result_queue.put(result)
-            except queue.Empty:
-                continue
-    
-    def submit(self, task):
-        self.task_queue.put(task)
+        while True:
+            task = self.task_queue.get()  # Bloquea sin sondeo hasta recibir mensaje
+            if task is None:  # Centinela de alto
+                break
+            self.result_queue.put(process_image_batch(task))
     
     def stop(self):
-        self._running = False
+        # Cada centinela detiene a un actor, el primero que lo tome
+        self.task_queue.put(None)
 
 # ========== VERSIÓN SECUENCIAL ==========
 def process_image_sequential(image_paths, selected_filter, output_folder):
     """Procesamiento secuencial para comparación"""
     results = []
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     for image_path in image_paths:
         result = process_image((image_path, selected_filter, output_folder))
         results.append(result)
     
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
+    return results, elapsed_time
+
+# ========== VERSIÓN CON EXECUTOR (SÍNCRONA) ==========
+def run_sync(executor, tasks, chunksize=1):
+    """Procesa todas las tareas en el executor y espera a que terminen"""
+    start_time = time.perf_counter()
+    results = list(executor.map(process_image, tasks, chunksize=chunksize))
+    elapsed_time = time.perf_counter() - start_time
     return results, elapsed_time
 
 # ========== VERSIÓN CON MODELO ACTOR ==========
 def process_image_actor(image_paths, selected_filter, output_folder, num_actors=4):
     """Procesamiento usando modelo Actor"""
     results = []
+    task_queue = queue.Queue()  # Cola única: el actor libre toma el siguiente lote
     result_queue = queue.Queue()
     actors = []
     
     # Crear actores
     for _ in range(num_actors):
-        actor = ProcessingActor(result_queue)
+        actor = ProcessingActor(task_queue, result_queue)
         actors.append(actor)
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    # Distribuir tareas entre actores (round-robin)
-    for i, image_path in enumerate(image_paths):
-        task = (image_path, selected_filter, output_folder)
-        actors[i % num_actors].submit(task)
+    # Encolar los lotes; cada actor toma uno nuevo al terminar el anterior (balanceo dinámico)
+    tasks = [(image_path, selected_filter, output_folder) for image_path in image_paths]
+    batches = make_batches(tasks, num_actors)
+    for batch in batches:
+        task_queue.put(batch)
     
-    # Recoger resultados
-    for _ in range(len(image_paths)):
-        result = result_queue.get()
-        results.append(result)
+    # Recoger resultados (una lista por lote)
+    for _ in range(len(batches)):
+        results.extend(result_queue.get())
     
     # Detener actores
     for actor in actors:
         actor.stop()
     
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
     return results, elapsed_time
 
 
+# ========== FILTROS CON OPENCV (OPCIONAL) ==========
+def _numpy_kernel(pil_filter):
+    """Convierte un filtro de PIL en (kernel, offset) para cv2.filter2D"""
+    size, scale, offset, kernel = pil_filter.filterargs
+    kernel = np.array(kernel, dtype=np.float32).reshape(size[1], size[0]) / scale
+    # PIL aplica la primera fila del kernel a la fila de abajo
+    return np.flipud(kernel), offset
+
+# Mismos kernels que PIL, aplicados con cv2.filter2D (SIMD interno)
+if HAS_CV2:
+    CV2_KERNELS = {
+        "Desenfoque": _numpy_kernel(ImageFilter.BLUR),
+        "Contorno": _numpy_kernel(ImageFilter.CONTOUR),
+        "Bordes": _numpy_kernel(ImageFilter.FIND_EDGES),
+    }
+
+def filter_cv2(img, selected_filter):
+    """Aplica el kernel del filtro con OpenCV sobre el arreglo RGB"""
+    kernel, offset = CV2_KERNELS[selected_filter]
+    out = cv2.filter2D(np.asarray(img), -1, kernel, delta=offset,
+                       borderType=cv2.BORDER_REPLICATE)
+    return Image.fromarray(out)
+
 ##==============================APLICACIÓN PRINCIPAL==============================##
 def process_image(args):
     """
@@ -129,30 +193,25 @@ def process_image(args):
     """
     image_path, selected_filter, output_folder = args
     try:
-        # Simular tiempo de procesamiento variable
-        time.sleep(0.1)  # Simula carga de trabajo
-        
-        img = Image.open(image_path).convert("RGB")
-        if selected_filter == "Desenfoque":
-            img = img.filter(ImageFilter.BLUR)
-        elif selected_filter == "Grises":
-            img = img.convert('L')
-        elif selected_filter == "Contorno":
-            img = img.filter(ImageFilter.CONTOUR)
-        elif selected_filter == "Emboss":
-            img = img.filter(ImageFilter.EMBOSS)
-        elif selected_filter == "Sharpen":
-            img = img.filter(ImageFilter.SHARPEN)
-        elif selected_filter == "Detalles":
-            img = img.filter(ImageFilter.DETAIL)
-        elif selected_filter == "Bordes":
-            img = img.filter(ImageFilter.FIND_EDGES)
-        
-        base = os.path.basename(image_path)
-        name, ext = os.path.splitext(base)
-        output_filename = f"{name}_{selected_filter.lower()}{ext}"
-        output_path = os.path.join(output_folder, output_filename)
-        img.save(output_path)
+        if SIMULATE_LOAD > 0:
+            time.sleep(SIMULATE_LOAD)  # Simula carga de trabajo
+        
+        # with: el descriptor del archivo se cierra al terminar, no al recolectar la imagen
+        with Image.open(image_path) as src:
+            # convert() copia la imagen aunque ya sea RGB
+            img = src.convert("RGB") if src.mode != "RGB" else src
+            if HAS_CV2 and selected_filter in CV2_KERNELS:
+                img = filter_cv2(img, selected_filter)
+            elif selected_filter == "Grises":
+                img = img.convert('L')
+            elif selected_filter in FILTERS:
+                img = img.filter(FILTERS[selected_filter])
+            
+            base = os.path.basename(image_path)
+            name, ext = os.path.splitext(base)
+            output_filename = f"{name}_{selected_filter.lower()}{ext}"
+            output_path = os.path.join(output_folder, output_filename)
+            img.save(output_path, **SAVE_OPTIONS.get(ext.lower(), {}))
         
         return {"status": "OK", "original": image_path, "output": output_path, 
                 "message": f"Procesado: {base}", "filter": selected_filter}
@@ -160,6 +219,29 @@ def process_image(args):
         return {"status": "ERROR", "original": image_path, 
                 "message": f"Error en {os.path.basename(image_path)}: {str(e)}"}
 
+def process_image_batch(batch):
+    """Procesa un lote de tareas en una sola llamada (un solo envío/pickle por lote)"""
+    return [process_image(task) for task in batch]
+
+def make_batches(tasks, num_workers):
+    """Divide las tareas en lotes de ceil(n / trabajadores / 4) imágenes"""
+    size = max(1, math.ceil(len(tasks) / (num_workers * 4)))
+    return [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+def init_worker():
+    """Inicializa cada proceso del pool: carga una sola vez los plugins de PIL"""
+    Image.init()
+
+@lru_cache(maxsize=64)
+def load_thumbnail(path, size, mtime):
+    """Miniatura (PIL) para la vista previa; mtime invalida la caché si el archivo cambia.
+    Se llama desde un hilo secundario: el PhotoImage se crea después en el hilo de Tk"""
+    with Image.open(path) as img:
+        img.thumbnail((size, size))
+        # thumbnail() no decodifica si la imagen ya es pequeña: cargar antes de cerrar el archivo
+        img.load()
+        return img
+
 class PhotoFilterApp(TkinterDnD.Tk):
     def __init__(self):
         super().__init__()
@@ -175,16 +257,18 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.processed_counter = SharedCounter()
         self.error_counter = SharedCounter()
         
-        # Semáforo para limitar procesamiento concurrente
-        self.semaphore = ProcessingSemaphore(max_concurrent=4)
-        
         # Carpeta de salida predeterminada
         self.output_folder = os.path.join(os.getcwd(), "output")
         os.makedirs(self.output_folder, exist_ok=True)
         
         # Executors para diferentes estrategias
-        self.process_executor = ProcessPoolExecutor(max_workers=4)
-        self.thread_executor = ThreadPoolExecutor(max_workers=4)
+        # (el pool de procesos se reutiliza entre ejecuciones con los plugins ya cargados)
+        self.num_workers = os.cpu_count() or 4
+        self.process_executor = ProcessPoolExecutor(max_workers=self.num_workers,
+                                                    initializer=init_worker)
+        # (el tamaño del pool ya limita la concurrencia, no hace falta semáforo)
+        self.num_threads = 4
+        self.thread_executor = ThreadPoolExecutor(max_workers=self.num_threads)
         
         # Métricas de desempeño
         self.metrics = {
@@ -194,10 +278,24 @@ class PhotoFilterApp(TkinterDnD.Tk):
             "actor_model": []
         }
         
+        # Resultados que envían los hilos de trabajo y ejecución en curso
+        self.pending_results = deque()  # append/popleft son atómicos
+        self.current_run = None
+        
         self.zoom_level = 300
+        self._pending_zoom = self.zoom_level
+        self._zoom_after_id = None
+        
+        # Miniaturas que prepara el hilo de vista previa; solo se muestra la última solicitud
+        self.preview_queue = queue.Queue()
+        self.preview_request = 0
         self.init_styles()
         self.create_widgets()
         
+        # Los hilos de trabajo avisan con este evento en lugar de sondear con after()
+        self.bind("<<ResultReady>>", self.drain_results)
+        self.bind("<<PreviewReady>>", self.show_preview)
+        
     def init_styles(self):
         style = ttk.Style(self)
         style.theme_use("clam")
@@ -388,38 +486,68 @@ class PhotoFilterApp(TkinterDnD.Tk):
             os.makedirs(self.output_folder, exist_ok=True)
     
     def update_preview(self, event=None):
+        """Pide las miniaturas de la imagen seleccionada a un hilo secundario"""
+        selection = self.listbox.curselection()
+        if selection:
+            index = selection[0]
+            if index < len(self.image_paths):
+                image_path = self.image_paths[index]
+                proc_path = self.processed_paths.get(image_path)
+                
+                self.preview_request += 1
+                threading.Thread(target=self.load_preview,
+                                 args=(self.preview_request, image_path, proc_path, self.zoom_level),
+                                 daemon=True).start()
+    
+    def load_preview(self, request, image_path, proc_path, size):
+        """Decodifica y reduce las imágenes fuera del hilo de Tk"""
         try:
-            selection = self.listbox.curselection()
-            if selection:
-                index = selection[0]
-                if index < len(self.image_paths):
-                    image_path = self.image_paths[index]
-                    
-                    # Vista original
-                    img = Image.open(image_path)
-                    img.thumbnail((self.zoom_level, self.zoom_level))
-                    self.orig_preview_image = ImageTk.PhotoImage(img)
-                    self.orig_preview_label.config(image=self.orig_preview_image)
-                    
-                    # Vista procesada
-                    if image_path in self.processed_paths:
-                        proc_path = self.processed_paths[image_path]
-                        proc_img = Image.open(proc_path)
-                        proc_img.thumbnail((self.zoom_level, self.zoom_level))
-                        self.filtered_preview_image = ImageTk.PhotoImage(proc_img)
-                        self.filtered_preview_label.config(image=self.filtered_preview_image)
-                    else:
-                        self.filtered_preview_label.config(image="", text="Imagen no procesada")
+            orig = load_thumbnail(image_path, size, os.path.getmtime(image_path))
+            proc = load_thumbnail(proc_path, size, os.path.getmtime(proc_path)) if proc_path else None
+            self.preview_queue.put((request, orig, proc, None))
         except Exception as e:
-            self.log_message(f"Error en vista previa: {str(e)}")
+            self.preview_queue.put((request, None, None, e))
+        self.event_generate("<<PreviewReady>>", when="tail")
+    
+    def show_preview(self, event=None):
+        """Muestra la miniatura más reciente (en el hilo de Tk, donde se crea el PhotoImage)"""
+        try:
+            while True:
+                request, orig, proc, error = self.preview_queue.get_nowait()
+                if request != self.preview_request:
+                    continue  # Respuesta de una selección o zoom anterior
+                if error is not None:
+                    self.log_message(f"Error en vista previa: {str(error)}")
+                    continue
+                
+                # Vista original
+                self.orig_preview_image = ImageTk.PhotoImage(orig)
+                self.orig_preview_label.config(image=self.orig_preview_image)
+                
+                # Vista procesada
+                if proc is not None:
+                    self.filtered_preview_image = ImageTk.PhotoImage(proc)
+                    self.filtered_preview_label.config(image=self.filtered_preview_image)
+                else:
+                    self.filtered_preview_label.config(image="", text="Imagen no procesada")
+        except queue.Empty:
+            pass
     
     def adjust_zoom(self, event):
+        """Agrupa los eventos del slider: solo se redibuja con el último valor"""
         try:
-            self.zoom_level = int(float(event))
-            self.update_preview()
+            self._pending_zoom = int(float(event))
+            if self._zoom_after_id:
+                self.after_cancel(self._zoom_after_id)
+            self._zoom_after_id = self.after(50, self._apply_zoom)
         except Exception as e:
             self.log_message(f"Error ajustando zoom: {str(e)}")
     
+    def _apply_zoom(self):
+        self._zoom_after_id = None
+        self.zoom_level = self._pending_zoom
+        self.update_preview()
+    
     def log_message(self, message):
         self.log.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n")
         self.log.see(tk.END)
@@ -427,7 +555,10 @@ class PhotoFilterApp(TkinterDnD.Tk):
     def update_metrics(self):
         self.metrics_labels["procesadas"].config(text=str(self.processed_counter.get_value()))
         self.metrics_labels["errores"].config(text=str(self.error_counter.get_value()))
-        self.metrics_labels["activos"].config(text=str(self.semaphore.get_active()))
+        # Activos: tareas pendientes de la ejecución en curso, acotadas por el tamaño del pool
+        run = self.current_run
+        active = min(run["total"] - run["done"], run["workers"]) if run else 0
+        self.metrics_labels["activos"].config(text=str(active))
     
     def apply_filter(self):
         if not self.image_paths:
@@ -456,46 +587,15 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.log.delete("1.0", tk.END)
         self.log_message(f"Iniciando procesamiento multiproceso ({len(tasks)} imágenes)...")
         
-        start_time = time.time()
-        threading.Thread(target=self.run_multiprocess_processing, 
-                        args=(tasks, start_time), daemon=True).start()
+        self.begin_run(len(tasks), self.num_workers, "parallel_process", "Procesamiento completado")
+        self.run_multiprocess_processing(tasks)
     
-    def run_multiprocess_processing(self, tasks, start_time):
+    def run_multiprocess_processing(self, tasks):
         """Ejecuta procesamiento con ProcessPoolExecutor"""
-        result_queue = queue.Queue()
-        futures = [self.process_executor.submit(process_image, task) for task in tasks]
-        total = len(futures)
-        
-        def update_ui():
-            try:
-                while True:
-                    result = result_queue.get_nowait()
-                    if result["status"] == "OK":
-                        self.processed_counter.increment()
-                        self.processed_paths[result["original"]] = result["output"]
-                        self.log_message(f"✓ {result['message']}")
-                    else:
-                        self.error_counter.increment()
-                        self.log_message(f"✗ {result['message']}")
-                    
-                    self.progress_bar["value"] += 1
-                    self.update_metrics()
-            except queue.Empty:
-                pass
-            
-            if self.progress_bar["value"] < total:
-                self.after(100, update_ui)
-            else:
-                elapsed = time.time() - start_time
-                self.metrics_labels["tiempo (s)"].config(text=f"{elapsed:.2f}")
-                self.metrics["parallel_process"].append(elapsed)
-                self.log_message(f"Procesamiento completado en {elapsed:.2f} segundos")
-        
-        self.after(100, update_ui)
-        
-        for future in as_completed(futures):
-            result = future.result()
-            result_queue.put(result)
+        # Enviar lotes de imágenes para reducir el pickle/IPC por imagen
+        for batch in make_batches(tasks, self.num_workers):
+            future = self.process_executor.submit(process_image_batch, batch)
+            future.add_done_callback(self.on_batch_done)
     
     def apply_filter_multithread(self, selected_filter):
         """Versión multihilo con ThreadPoolExecutor"""
@@ -505,56 +605,16 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.log.delete("1.0", tk.END)
         self.log_message(f"Iniciando procesamiento multihilo ({len(tasks)} imágenes)...")
         
-        start_time = time.time()
-        threading.Thread(target=self.run_multithread_processing, 
-                        args=(tasks, start_time), daemon=True).start()
+        self.begin_run(len(tasks), self.num_threads, "parallel_thread",
+                       "Procesamiento multihilo completado")
+        self.run_multithread_processing(tasks)
     
-    def run_multithread_processing(self, tasks, start_time):
+    def run_multithread_processing(self, tasks):
         """Ejecuta procesamiento con ThreadPoolExecutor"""
-        result_queue = queue.Queue()
-        
-        def process_with_semaphore(task):
-            """Función wrapper con semáforo"""
-            self.semaphore.acquire()
-            try:
-                result = process_image(task)
-                return result
-            finally:
-                self.semaphore.release()
-        
-        futures = [self.thread_executor.submit(process_with_semaphore, task) for task in tasks]
-        total = len(futures)
-        
-        def update_ui():
-            try:
-                while True:
-                    result = result_queue.get_nowait()
-                    if result["status"] == "OK":
-                        self.processed_counter.increment()
-                        self.processed_paths[result["original"]] = result["output"]
-                        self.log_message(f"✓ {result['message']}")
-                    else:
-                        self.error_counter.increment()
-                        self.log_message(f"✗ {result['message']}")
-                    
-                    self.progress_bar["value"] += 1
-                    self.update_metrics()
-            except queue.Empty:
-                pass
-            
-            if self.progress_bar["value"] < total:
-                self.after(100, update_ui)
-            else:
-                elapsed = time.time() - start_time
-                self.metrics_labels["tiempo (s)"].config(text=f"{elapsed:.2f}")
-                self.metrics["parallel_thread"].append(elapsed)
-                self.log_message(f"Procesamiento multihilo completado en {elapsed:.2f} segundos")
-        
-        self.after(100, update_ui)
-        
-        for future in as_completed(futures):
-            result = future.result()
-            result_queue.put(result)
+        # Cada futuro entrega su resultado al terminar, sin hilo intermedio que espere
+        for task in tasks:
+            future = self.thread_executor.submit(process_image, task)
+            future.add_done_callback(self.on_future_done)
     
     def apply_filter_actor(self, selected_filter):
         """Versión con modelo Actor"""
@@ -564,50 +624,67 @@ class PhotoFilterApp(TkinterDnD.Tk):
         self.log.delete("1.0", tk.END)
         self.log_message(f"Iniciando procesamiento con modelo Actor ({len(tasks)} imágenes)...")
         
-        start_time = time.time()
+        self.begin_run(len(tasks), self.num_threads, "actor_model", "Procesamiento Actor completado")
         threading.Thread(target=self.run_actor_processing, 
-                        args=(tasks, start_time), daemon=True).start()
+                        args=(tasks,), daemon=True).start()
     
-    def run_actor_processing(self, tasks, start_time):
+    def run_actor_processing(self, tasks):
         """Ejecuta procesamiento con modelo Actor"""
-        result_queue = queue.Queue()
         results, elapsed = process_image_actor(
             [t[0] for t in tasks], 
             tasks[0][1], 
             tasks[0][2],
-            num_actors=4
+            num_actors=self.num_threads
         )
+        # El modelo Actor reporta su propio tiempo de ejecución
+        self.current_run["elapsed"] = elapsed
+        self.post_results(results)
+    
+    def begin_run(self, total, workers, metric, message):
+        """Registra la ejecución en curso para saber cuándo termina"""
+        self.current_run = {"total": total, "done": 0, "workers": workers,
+                            "start": time.perf_counter(), "elapsed": None,
+                            "metric": metric, "message": message}
+    
+    def post_results(self, results):
+        """Encola resultados desde un hilo de trabajo y avisa al hilo de Tk"""
+        self.pending_results.extend(results)
+        self.event_generate("<<ResultReady>>", when="tail")
+    
+    def on_future_done(self, future):
+        self.post_results([future.result()])
+    
+    def on_batch_done(self, future):
+        self.post_results(future.result())
+    
+    def drain_results(self, event=None):
+        """Vacía la cola de resultados y actualiza la interfaz (en el hilo de Tk)"""
+        run = self.current_run
+        if run is None:
+            return
+        try:
+            while True:
+                result = self.pending_results.popleft()
+                if result["status"] == "OK":
+                    self.processed_counter.increment()
+                    self.processed_paths[result["original"]] = result["output"]
+                    self.log_message(f"✓ {result['message']}")
+                else:
+                    self.error_counter.increment()
+                    self.log_message(f"✗ {result['message']}")
+                
+                self.progress_bar["value"] += 1
+                run["done"] += 1
+        except IndexError:
+            pass
+        self.update_metrics()
         
-        total = len(results)
-        processed = 0
-        
-        def update_ui():
-            nonlocal processed
-            try:
-                while results:
-                    result = results.pop(0)
-                    if result["status"] == "OK":
-                        self.processed_counter.increment()
-                        self.processed_paths[result["original"]] = result["output"]
-                        self.log_message(f"✓ {result['message']}")
-                    else:
-                        self.error_counter.increment()
-                        self.log_message(f"✗ {result['message']}")
-                    
-                    self.progress_bar["value"] += 1
-                    processed += 1
-                    self.update_metrics()
-            except IndexError:
-                pass
-            
-            if processed < total:
-                self.after(100, update_ui)
-            else:
-                self.metrics_labels["tiempo (s)"].config(text=f"{elapsed:.2f}")
-                self.metrics["actor_model"].append(elapsed)
-                self.log_message(f"Procesamiento Actor completado en {elapsed:.2f} segundos")
-        
-        self.after(100, update_ui)
+        if run["done"] >= run["total"]:
+            elapsed = run["elapsed"] if run["elapsed"] is not None else time.perf_counter() - run["start"]
+            self.metrics_labels["tiempo (s)"].config(text=f"{elapsed:.2f}")
+            self.metrics[run["metric"]].append(elapsed)
+            self.log_message(f"{run['message']} en {elapsed:.2f} segundos")
+            self.current_run = None
     
     def compare_strategies(self):
         """Compara todas las estrategias de procesamiento"""
@@ -620,20 +697,31 @@ class PhotoFilterApp(TkinterDnD.Tk):
         
         self.log.delete("1.0", tk.END)
         self.log_message("Iniciando comparación de estrategias...")
-        
-        # Ejecutar secuencial
-        self.log_message("Ejecutando versión secuencial...")
-        _, seq_time = process_image_sequential(
-            [t[0] for t in tasks], 
-            tasks[0][1], 
-            tasks[0][2]
-        )
-        self.metrics["sequential"].append(seq_time)
-        
-        # Ejecutar paralelo (ya se ejecutan en los métodos anteriores)
-        # Aquí solo actualizamos el gráfico
-        
-        self.update_comparison_chart()
+        threading.Thread(target=self.run_comparison, args=(tasks,), daemon=True).start()
+    
+    def run_comparison(self, tasks):
+        """Ejecuta cada estrategia una vez, seguidas, sobre las mismas tareas"""
+        paths = [t[0] for t in tasks]
+        selected_filter, output_folder = tasks[0][1], tasks[0][2]
+        chunk = max(1, len(tasks) // (4 * self.num_workers))
+        
+        runs = [
+            ("sequential", "secuencial",
+             lambda: process_image_sequential(paths, selected_filter, output_folder)),
+            ("parallel_process", "multiproceso",
+             lambda: run_sync(self.process_executor, tasks, chunk)),
+            ("parallel_thread", "multihilo",
+             lambda: run_sync(self.thread_executor, tasks)),
+            ("actor_model", "modelo Actor",
+             lambda: process_image_actor(paths, selected_filter, output_folder, num_actors=self.num_threads)),
+        ]
+        for metric, name, run in runs:
+            self.after(0, self.log_message, f"Ejecutando versión {name}...")
+            _, elapsed = run()
+            self.metrics[metric].append(elapsed)
+            self.after(0, self.log_message, f"   {name}: {elapsed:.2f} segundos")
+        
+        self.after(0, self.update_comparison_chart)
     
     def update_comparison_chart(self):
         """Actualiza el gráfico de comparación"""